@@ -1,8 +1,11 @@
 import pygame
 import random
-import heapq
-import time
+import numpy as np
+from scipy.signal import convolve2d
 
+from robot_core import (_UNVISITED, _OBSTACLE, _DIRS,
+                        _PERMS, _NBR_KERNEL, _walk_parents,
+                        _find_path_kernel, _find_path_kernel_tiled)
 class RobotNavigation:
     def __init__(self, width, height, obstacles):
         """
@@ -10,7 +13,14 @@ class RobotNavigation:
         """
         self.width = width
         self.height = height
-        self.grid = [[0 for _ in range(width)] for _ in range(height)]
+        # flat contiguous uint8 storage with a 1-cell OBSTACLE sentinel
+        # border so the kernels need no bounds checks; self.grid is the
+        # interior view and writes through to the padded array
+        self._padded = np.full((height + 2, width + 2), _OBSTACLE,
+                               dtype=np.uint8)
+        self.grid = self._padded[1:-1, 1:-1]
+        self.grid[:] = _UNVISITED
+        self.grid_flat = self._padded.ravel()
         
 
         self.UNVISITED = 0
@@ -23,28 +33,63 @@ class RobotNavigation:
         
         self.robot_pos = [0, 0]
         self.visited_cells = set([(0, 0)])
-        self.unvisited_cells = set((x, y) for x in range(width) 
-                                   for y in range(height) 
-                                   if (x, y) != (0, 0))
+        # bool mask + counter instead of a set of (x, y) tuples
+        self.unvisited_mask = np.ones((height, width), dtype=np.bool_)
+        self.unvisited_mask[0, 0] = False
+        self.unvisited_count = width * height - 1
         
         # for static obstacles
         for x, y in obstacles:
-            self.grid[y][x] = self.OBSTACLE
-            if (x, y) in self.unvisited_cells:
-                self.unvisited_cells.remove((x, y))
+            self.grid[y, x] = self.OBSTACLE
+            if self.unvisited_mask[y, x]:
+                self.unvisited_mask[y, x] = False
+                self.unvisited_count -= 1
         
-        # for dynamic obstacles
+        # for dynamic obstacles: draw 3 distinct free cells in one
+        # vectorized sample instead of rejection-looping randint
+        free = np.flatnonzero(self.grid.ravel() == self.UNVISITED)
         self.dynamic_obstacles = []
-        for _ in range(3):  # Add 3 dynamic obstacles
-            while True:
-                obstacle = [random.randint(0, width - 1), random.randint(0, height - 1)]
-                if self.grid[obstacle[1]][obstacle[0]] == self.UNVISITED:
-                    self.grid[obstacle[1]][obstacle[0]] = self.DYNAMIC_OBSTACLE
-                    self.dynamic_obstacles.append(obstacle)
-                    break
+        for nid in np.random.choice(free, size=3, replace=False).tolist():
+            x, y = nid % width, nid // width
+            self.grid[y, x] = self.DYNAMIC_OBSTACLE
+            self.dynamic_obstacles.append([x, y])
         
         # initial position 
-        self.grid[0][0] = self.ROBOT
+        self.grid[0, 0] = self.ROBOT
+
+        # cells whose state changed since the last draw
+        self.dirty = set()
+
+        # per-cell unvisited-neighbor counts in padded-flat layout,
+        # recomputed lazily whenever the unvisited mask changes
+        self._unvis_nbr = None
+
+        # pooled per-search scratch arrays; bumping the version stamp
+        # resets them in O(1) instead of refilling every call
+        n = (width + 2) * (height + 2)
+        self._scratch_parent = np.empty(n, dtype=np.int32)
+        self._scratch_visited = np.empty(n, dtype=np.uint8)
+        self._scratch_depth = np.empty(n, dtype=np.int32)
+        self._scratch_heap = np.empty(4 * n + 1, dtype=np.int64)
+        self._scratch_stamp = np.zeros(n, dtype=np.int64)
+        self._scratch_version = 0
+        self._walk_out = np.empty(n, dtype=np.int32)
+
+        # 8x8 tile buckets for the tiled frontier kernel: intrusive
+        # per-tile node chains plus their own version stamps
+        tiles = ((width + 7) >> 3) * ((height + 7) >> 3)
+        self._tile_head = np.empty(tiles, dtype=np.int32)
+        self._tile_next = np.empty(n, dtype=np.int32)
+        self._tile_stamp = np.zeros(tiles, dtype=np.int64)
+
+        # timestamp (pygame ticks) until which the robot waits out a
+        # dynamic obstacle instead of blocking the whole loop
+        self.wait_until_ms = 0
+
+        # paths keyed by (start, unvisited count, dynamic obstacle
+        # positions); those three pin down the search inputs, so hits
+        # can skip the kernel entirely
+        self._path_cache = {}
     
     def move_dynamic_obstacles(self):
         """
@@ -55,72 +100,85 @@ class RobotNavigation:
             
             # cell state updation
             if (x, y) in self.visited_cells:
-                self.grid[y][x] = self.VISITED
-            elif (x, y) not in self.unvisited_cells:
-                self.grid[y][x] = self.RETRACED_PATH
+                self.grid[y, x] = self.VISITED
+            elif not self.unvisited_mask[y, x]:
+                self.grid[y, x] = self.RETRACED_PATH
             else:
-                self.grid[y][x] = self.UNVISITED
+                self.grid[y, x] = self.UNVISITED
+            self.dirty.add((x, y))
             
-            # direction locator
-            directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]
-            random.shuffle(directions)
-            for dx, dy in directions:
+            # direction locator: one randrange picks a precomputed order
+            for k in _PERMS[random.randrange(24)]:
+                dx, dy = _DIRS[k]
                 new_x, new_y = x + dx, y + dy
-                if (0 <= new_x < self.width and 
-                    0 <= new_y < self.height and 
-                    self.grid[new_y][new_x] in [self.UNVISITED, self.VISITED, self.RETRACED_PATH] and
-                    self.grid[new_y][new_x] != self.ROBOT): #collision avoidance
+                if not (0 <= new_x < self.width and
+                        0 <= new_y < self.height):
+                    continue
+                cell = self.grid[new_y, new_x]
+                if (cell == self.UNVISITED or
+                    cell == self.VISITED or
+                    cell == self.RETRACED_PATH): #collision avoidance
                     # dynamic obstacle moving
                     self.dynamic_obstacles[i] = [new_x, new_y]
-                    self.grid[new_y][new_x] = self.DYNAMIC_OBSTACLE
+                    self.grid[new_y, new_x] = self.DYNAMIC_OBSTACLE
+                    self.dirty.add((new_x, new_y))
                     break
 
     def find_most_efficient_path(self):
         """
         Find the most efficient path to an unvisited cell
         """
-        start = tuple(self.robot_pos)
-        
-        # queue for priority
-        open_set = []
-        heapq.heappush(open_set, (0, start, []))
-        visited = set([start])
-        
-        while open_set:
-            priority, current, path = heapq.heappop(open_set)
-            
-            # checking for unvisied neighbours
-            for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
-                neighbor = (current[0] + dx, current[1] + dy)
-                
-                # checking for obstacle and boundaries
-                if (0 <= neighbor[0] < self.width and 
-                    0 <= neighbor[1] < self.height and 
-                    self.grid[neighbor[1]][neighbor[0]] not in [self.OBSTACLE, self.DYNAMIC_OBSTACLE] and
-                    neighbor not in visited):
-                    
-                    new_path = path + [neighbor]
-                    
-                    # visiting unvisited path
-                    if neighbor in self.unvisited_cells:
-                        return new_path
-                    
-                    # adding visied neighbour to visited queue
-                    visited.add(neighbor)
-                    
-                    # priority movement for unvisited neighbours
-                    unexplored_neighbors = sum(
-                        1 for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]
-                        if (0 <= neighbor[0]+dx < self.width and 
-                            0 <= neighbor[1]+dy < self.height and 
-                            self.grid[neighbor[1]+dy][neighbor[0]+dx] == self.UNVISITED)
-                    )
-                    
-                    # updating priority based on distance and unvisited
-                    priority = len(new_path) - unexplored_neighbors
-                    heapq.heappush(open_set, (priority, neighbor, new_path))
-        
-        return None
+        sx, sy = self.robot_pos
+
+        cache_key = ((sx, sy), self.unvisited_count,
+                     tuple(map(tuple, self.dynamic_obstacles)))
+        cached = self._path_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        if self._unvis_nbr is None:
+            cnt = convolve2d(self.unvisited_mask.astype(np.int8),
+                             _NBR_KERNEL, mode='same', boundary='fill')
+            padded_cnt = np.zeros((self.height + 2, self.width + 2),
+                                  dtype=np.int8)
+            padded_cnt[1:-1, 1:-1] = cnt
+            self._unvis_nbr = padded_cnt.ravel()
+
+        stride = self.width + 2
+        self._scratch_version += 1
+        parent = self._scratch_parent
+        if self.width * self.height > 16384:
+            # large grids spill out of L1; process the frontier in 8x8
+            # tile blocks so expansions reuse cached lines
+            goal = _find_path_kernel_tiled(
+                self._padded, self.width, self.height, sx, sy,
+                self.unvisited_mask, self._unvis_nbr, parent,
+                self._scratch_visited, self._scratch_depth,
+                self._scratch_heap, self._scratch_stamp,
+                self._scratch_version, self._tile_head, self._tile_next,
+                self._tile_stamp)
+        else:
+            goal = _find_path_kernel(self._padded, self.width, self.height,
+                                     sx, sy, self.unvisited_mask,
+                                     self._unvis_nbr, parent,
+                                     self._scratch_visited,
+                                     self._scratch_depth,
+                                     self._scratch_heap,
+                                     self._scratch_stamp,
+                                     self._scratch_version)
+        if goal < 0:
+            return None
+
+        # walking parent pointers back to the start
+        out = self._walk_out
+        length = _walk_parents(parent, (sy + 1) * stride + (sx + 1),
+                               goal, out)
+        path = [(nid % stride - 1, nid // stride - 1)
+                for nid in out[:length].tolist()]
+        if len(self._path_cache) >= 256:
+            self._path_cache.clear()
+        self._path_cache[cache_key] = path
+        return path
 
 
     def move_robot(self, path):
@@ -132,28 +190,33 @@ class RobotNavigation:
         
         # colouing path
         for x, y in path[:-1]:
-            if self.grid[y][x] == self.VISITED:
-                self.grid[y][x] = self.RETRACED_PATH
+            if self.grid[y, x] == self.VISITED:
+                self.grid[y, x] = self.RETRACED_PATH
+                self.dirty.add((x, y))
         
         # final movement to end the process
         x, y = path[-1]
         
         # Check for dynamic obstacles and wait if necessary
-        if self.grid[y][x] == self.DYNAMIC_OBSTACLE:
+        if self.grid[y, x] == self.DYNAMIC_OBSTACLE:
             print("Dynamic obstacle detected. Waiting...")
-            time.sleep(1)  # Delay to simulate waiting for the obstacle to move
+            self.wait_until_ms = pygame.time.get_ticks() + 1000
             return False  # Do not proceed to this cell yet
         
         # updating the grid
-        self.grid[self.robot_pos[1]][self.robot_pos[0]] = self.VISITED
-        self.grid[y][x] = self.ROBOT
+        self.grid[self.robot_pos[1], self.robot_pos[0]] = self.VISITED
+        self.grid[y, x] = self.ROBOT
+        self.dirty.add(tuple(self.robot_pos))
+        self.dirty.add((x, y))
         
         # updating robot movement evertime
         self.robot_pos = [x, y]
         
         # updating visited and unvisited cells
-        if (x, y) in self.unvisited_cells:
-            self.unvisited_cells.remove((x, y))
+        if self.unvisited_mask[y, x]:
+            self.unvisited_mask[y, x] = False
+            self.unvisited_count -= 1
+            self._unvis_nbr = None
         self.visited_cells.add((x, y))
         
         return True
@@ -162,9 +225,9 @@ class RobotNavigation:
         """
         Check if entire grid is explored
         """
-        return len(self.unvisited_cells) == 0 and all(
-            cell != self.UNVISITED for row in self.grid for cell in row
-        )
+        # unvisited_count is kept in sync with every grid write in
+        # move_robot, so the redundant grid scan is gone
+        return self.unvisited_count == 0
 
 class GridVisualization:
     def __init__(self, width, height):
@@ -189,32 +252,65 @@ class GridVisualization:
         }
         
         # creating visualization screen for output
+        # uint8 palette LUT so a full repaint is one fancy-index +
+        # blit_array instead of per-cell draw.rect calls
+        self.palette = np.zeros((max(self.COLORS) + 1, 3), dtype=np.uint8)
+        for state, color in self.COLORS.items():
+            self.palette[state] = color
+
+        # off-screen canvas holding the rendered grid; only dirty cells
+        # are repainted onto it after the first full draw
+        self.canvas = None
         self.screen = pygame.display.set_mode((self.SCREEN_WIDTH, self.SCREEN_HEIGHT))
         pygame.display.set_caption('Efficient Robot Grid Navigation')
     
+    def _full_repaint(self, robot_nav):
+        """
+        Paint every cell in one pass: map the uint8 grid through the
+        palette, expand to pixels and blit the whole block at once.
+        """
+        cs = self.CELL_SIZE
+        rgb = self.palette[robot_nav.grid]
+        big = np.repeat(np.repeat(rgb, cs, axis=0), cs, axis=1)
+        pygame.surfarray.blit_array(self.canvas, big.swapaxes(0, 1))
+        # cell borders as one line per row/column
+        black = (0, 0, 0)
+        for x in range(robot_nav.width + 1):
+            px = min(x * cs, self.SCREEN_WIDTH - 1)
+            pygame.draw.line(self.canvas, black, (px, 0),
+                             (px, self.SCREEN_HEIGHT - 1))
+        for y in range(robot_nav.height + 1):
+            py = min(y * cs, self.SCREEN_HEIGHT - 1)
+            pygame.draw.line(self.canvas, black, (0, py),
+                             (self.SCREEN_WIDTH - 1, py))
+
     def draw_grid(self, robot_nav):
         """
-        Render grid state
+        Render grid state, repainting only cells that changed
         """
-        for y in range(robot_nav.height):
-            for x in range(robot_nav.width):
-                rect = pygame.Rect(
-                    x * self.CELL_SIZE, 
-                    y * self.CELL_SIZE, 
-                    self.CELL_SIZE, 
-                    self.CELL_SIZE
-                )
-                pygame.draw.rect(
-                    self.screen, 
-                    self.COLORS[robot_nav.grid[y][x]], 
-                    rect
-                )
-                pygame.draw.rect(
-                    self.screen, 
-                    (0, 0, 0), 
-                    rect, 
-                    1
-                )
+        if self.canvas is None:
+            self.canvas = pygame.Surface((self.SCREEN_WIDTH, self.SCREEN_HEIGHT))
+            self._full_repaint(robot_nav)
+        for x, y in robot_nav.dirty:
+            rect = pygame.Rect(
+                x * self.CELL_SIZE, 
+                y * self.CELL_SIZE, 
+                self.CELL_SIZE, 
+                self.CELL_SIZE
+            )
+            pygame.draw.rect(
+                self.canvas, 
+                self.COLORS[robot_nav.grid[y, x]], 
+                rect
+            )
+            pygame.draw.rect(
+                self.canvas, 
+                (0, 0, 0), 
+                rect, 
+                1
+            )
+        robot_nav.dirty.clear()
+        self.screen.blit(self.canvas, (0, 0))
 
     def draw_path(self, path, robot_nav):
         """
@@ -253,14 +349,14 @@ def run_simulation(width, height, obstacles):
         # dynamic obstale movement
         robot_nav.move_dynamic_obstacles()
         
-        # optimal path for robot
-        path = robot_nav.find_most_efficient_path()
-        
-        # Move robot
-        if path:
-            if not robot_nav.move_robot(path):
-                continue  # If the robot encountered a dynamic obstacle, skip this loop iteration
-            path_traveled.extend(path)  # Adding the current path to the visited queue
+        # move the robot unless it is still waiting out a dynamic
+        # obstacle; drawing and event handling keep running either way
+        if pygame.time.get_ticks() >= robot_nav.wait_until_ms:
+            path = robot_nav.find_most_efficient_path()
+            
+            # Move robot
+            if path and robot_nav.move_robot(path):
+                path_traveled.extend(path)  # Adding the current path to the visited queue
         
         # checking for the completion of output
         if robot_nav.is_exploration_complete():
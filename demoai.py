@@ -1,6 +1,116 @@
 import pygame
 import random
 import heapq
+import numpy as np
+from scipy.signal import convolve2d
+
+from robot_core import (_UNVISITED, _OBSTACLE, _DYNAMIC_OBSTACLE, _INF,
+                        _DIRS, _PERMS, _NBR_KERNEL, _walk_parents,
+                        _find_path_kernel, _find_path_kernel_tiled,
+                        _astar_kernel)
+class LifelongAStar:
+    """
+    Incremental (LPA*-style) planner for a fixed target cell.
+
+    The search runs outward from the target with a zero heuristic, so the
+    robots can move freely between queries without invalidating anything;
+    only dynamic-obstacle moves have to call notify(). Each query then
+    repairs just the nodes affected since the last call instead of
+    replanning from scratch.
+    """
+
+    def __init__(self, nav, target):
+        self.nav = nav
+        self.stride = nav.width + 2
+        self.target_cell = target
+        tx, ty = target
+        self.target = (ty + 1) * self.stride + (tx + 1)
+        self.offsets = (self.stride, 1, -self.stride, -1)
+        n = self.stride * (nav.height + 2)
+        self.g = np.full(n, _INF, dtype=np.int64)
+        self.rhs = np.full(n, _INF, dtype=np.int64)
+        self.rhs[self.target] = 0
+        self.queue = [((0, 0), self.target)]
+
+    def _key(self, nid):
+        k = min(self.g[nid], self.rhs[nid])
+        # h == 0 because the search fans out from the fixed target
+        return (k, k)
+
+    def _update(self, nid):
+        flat = self.nav.grid_flat
+        if nid != self.target:
+            best = _INF
+            if flat[nid] != _OBSTACLE and flat[nid] != _DYNAMIC_OBSTACLE:
+                g = self.g
+                for off in self.offsets:
+                    nbr = nid + off
+                    if (flat[nbr] != _OBSTACLE and
+                            flat[nbr] != _DYNAMIC_OBSTACLE and
+                            g[nbr] + 1 < best):
+                        best = g[nbr] + 1
+            self.rhs[nid] = best
+        if self.g[nid] != self.rhs[nid]:
+            heapq.heappush(self.queue, (self._key(nid), nid))
+
+    def notify(self, cell):
+        """Re-evaluate a cell whose passability changed, plus neighbors."""
+        x, y = cell
+        nid = (y + 1) * self.stride + (x + 1)
+        self._update(nid)
+        for off in self.offsets:
+            self._update(nid + off)
+
+    def compute_shortest_path(self, start):
+        """Repair the search for the current grid and walk a path from
+        start to the target; returns None when the target is cut off."""
+        sx, sy = start
+        snid = (sy + 1) * self.stride + (sx + 1)
+        g, rhs, queue = self.g, self.rhs, self.queue
+        while queue:
+            k_old, nid = queue[0]
+            if k_old >= self._key(snid) and rhs[snid] == g[snid]:
+                break
+            heapq.heappop(queue)
+            k_new = self._key(nid)
+            if k_old < k_new:
+                # stale entry; requeue with its current key if still
+                # inconsistent
+                if g[nid] != rhs[nid]:
+                    heapq.heappush(queue, (k_new, nid))
+            elif g[nid] > rhs[nid]:
+                g[nid] = rhs[nid]
+                for off in self.offsets:
+                    self._update(nid + off)
+            elif g[nid] < rhs[nid]:
+                g[nid] = _INF
+                self._update(nid)
+                for off in self.offsets:
+                    self._update(nid + off)
+        if g[snid] >= _INF:
+            return None
+
+        # descend the g gradient from the robot to the target
+        stride = self.stride
+        flat = self.nav.grid_flat
+        path = [start]
+        nid = snid
+        while nid != self.target:
+            best_nbr = -1
+            best_g = _INF
+            for off in self.offsets:
+                nbr = nid + off
+                if (flat[nbr] != _OBSTACLE and
+                        flat[nbr] != _DYNAMIC_OBSTACLE and
+                        g[nbr] < best_g):
+                    best_g = g[nbr]
+                    best_nbr = nbr
+            if best_nbr < 0:
+                return None
+            nid = best_nbr
+            path.append((nid % stride - 1, nid // stride - 1))
+        return path
+
 
 def make_hashable(position):
     """
@@ -15,7 +125,14 @@ class RobotNavigation:
         """
         self.width = width
         self.height = height
-        self.grid = [[0 for _ in range(width)] for _ in range(height)]
+        # flat contiguous uint8 storage with a 1-cell OBSTACLE sentinel
+        # border so the kernels need no bounds checks; self.grid is the
+        # interior view and writes through to the padded array
+        self._padded = np.full((height + 2, width + 2), _OBSTACLE,
+                               dtype=np.uint8)
+        self.grid = self._padded[1:-1, 1:-1]
+        self.grid[:] = _UNVISITED
+        self.grid_flat = self._padded.ravel()
 
         self.UNVISITED = 0
         self.VISITED = 1
@@ -26,32 +143,71 @@ class RobotNavigation:
 
         self.robot_positions = [make_hashable(pos) for pos in robot_positions]
         self.visited_cells = set(self.robot_positions)
-        self.unvisited_cells = set((x, y) for x in range(width)
-                                    for y in range(height)
-                                    if (x, y) not in self.robot_positions)
+        # bool mask + counter instead of a set of (x, y) tuples
+        self.unvisited_mask = np.ones((height, width), dtype=np.bool_)
+        for x, y in self.robot_positions:
+            self.unvisited_mask[y, x] = False
+        self.unvisited_count = int(self.unvisited_mask.sum())
 
         # for static obstacles
         for x, y in obstacles:
-            self.grid[y][x] = self.OBSTACLE
-            if (x, y) in self.unvisited_cells:
-                self.unvisited_cells.remove((x, y))
-
-        # for dynamic obstacles
+            self.grid[y, x] = self.OBSTACLE
+            if self.unvisited_mask[y, x]:
+                self.unvisited_mask[y, x] = False
+                self.unvisited_count -= 1
+
+        # for dynamic obstacles: draw 5 distinct free cells in one
+        # vectorized sample instead of rejection-looping randint
+        free = np.flatnonzero(self.grid.ravel() == self.UNVISITED)
         self.dynamic_obstacles = []
-        for _ in range(5):
-            while True:
-                obstacle = [random.randint(0, width - 1), random.randint(0, height - 1)]
-                if self.grid[obstacle[1]][obstacle[0]] == self.UNVISITED:
-                    self.grid[obstacle[1]][obstacle[0]] = self.DYNAMIC_OBSTACLE
-                    self.dynamic_obstacles.append(make_hashable(obstacle))
-                    break
+        for nid in np.random.choice(free, size=5, replace=False).tolist():
+            x, y = nid % width, nid // width
+            self.grid[y, x] = self.DYNAMIC_OBSTACLE
+            self.dynamic_obstacles.append((x, y))
 
         # initial robot positions
         for x, y in self.robot_positions:
-            self.grid[y][x] = self.ROBOT
+            self.grid[y, x] = self.ROBOT
+
+        # cells whose state changed since the last draw
+        self.dirty = set()
+
+        # per-cell unvisited-neighbor counts in padded-flat layout,
+        # recomputed lazily whenever the unvisited mask changes
+        self._unvis_nbr = None
+
+        # pooled per-search scratch arrays; bumping the version stamp
+        # resets them in O(1) instead of refilling every call
+        n = (width + 2) * (height + 2)
+        self._scratch_parent = np.empty(n, dtype=np.int32)
+        self._scratch_visited = np.empty(n, dtype=np.uint8)
+        self._scratch_depth = np.empty(n, dtype=np.int32)
+        self._scratch_heap = np.empty(4 * n + 1, dtype=np.int64)
+        self._scratch_stamp = np.zeros(n, dtype=np.int64)
+        self._scratch_version = 0
+        self._walk_out = np.empty(n, dtype=np.int32)
+        self._scratch_g = np.empty(n, dtype=np.int32)
+        self._scratch_h = np.empty(n, dtype=np.int32)
+        self._scratch_best = np.empty(n, dtype=np.int64)
+
+        # 8x8 tile buckets for the tiled frontier kernel: intrusive
+        # per-tile node chains plus their own version stamps
+        tiles = ((width + 7) >> 3) * ((height + 7) >> 3)
+        self._tile_head = np.empty(tiles, dtype=np.int32)
+        self._tile_next = np.empty(n, dtype=np.int32)
+        self._tile_stamp = np.zeros(tiles, dtype=np.int64)
 
         self.robot_paths = {i: [] for i in range(len(robot_positions))}  # track paths for each robot
 
+        # paths keyed by (start, target/unvisited signature, dynamic
+        # obstacle positions); every component of the key pins down the
+        # search inputs, so hits can skip the kernel entirely
+        self._path_cache = {}
+
+        # lazily created incremental planner for the single-target
+        # endgame; rebuilt whenever the remaining target changes
+        self._endgame_planner = None
+
     def move_dynamic_obstacles(self):
         """
         Move the dynamic obstacles randomly but not blocking essential paths
@@ -61,60 +217,66 @@ class RobotNavigation:
 
             # cell state updation
             if (x, y) in self.visited_cells:
-                self.grid[y][x] = self.VISITED
-            elif (x, y) not in self.unvisited_cells:
-                self.grid[y][x] = self.RETRACED_PATH
+                self.grid[y, x] = self.VISITED
+            elif not self.unvisited_mask[y, x]:
+                self.grid[y, x] = self.RETRACED_PATH
             else:
-                self.grid[y][x] = self.UNVISITED
-
-            # direction locator
-            directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]
-            random.shuffle(directions)
-            for dx, dy in directions:
+                self.grid[y, x] = self.UNVISITED
+            self.dirty.add((x, y))
+            if self._endgame_planner is not None:
+                self._endgame_planner.notify((x, y))
+
+            # direction locator: one randrange picks a precomputed order
+            for k in _PERMS[random.randrange(24)]:
+                dx, dy = _DIRS[k]
                 new_x, new_y = x + dx, y + dy
-                if (0 <= new_x < self.width and
-                        0 <= new_y < self.height and
-                        self.grid[new_y][new_x] in [self.UNVISITED, self.VISITED, self.RETRACED_PATH] and
-                        self.grid[new_y][new_x] != self.ROBOT):  # collision avoidance
+                if not (0 <= new_x < self.width and
+                        0 <= new_y < self.height):
+                    continue
+                cell = self.grid[new_y, new_x]
+                if (cell == self.UNVISITED or
+                        cell == self.VISITED or
+                        cell == self.RETRACED_PATH):  # collision avoidance
                     self.dynamic_obstacles[i] = (new_x, new_y)
-                    self.grid[new_y][new_x] = self.DYNAMIC_OBSTACLE
+                    self.grid[new_y, new_x] = self.DYNAMIC_OBSTACLE
+                    self.dirty.add((new_x, new_y))
+                    if self._endgame_planner is not None:
+                        self._endgame_planner.notify((new_x, new_y))
                     break
 
     def astar_pathfinding(self, start, target):
         """
         A* pathfinding algorithm to find the shortest path from start to target
         """
-        open_set = []
-        heapq.heappush(open_set, (0, start, []))
-        g_score = {start: 0}
-        visited = set()
-
-        while open_set:
-            _, current, path = heapq.heappop(open_set)
-
-            if current == target:
-                return path + [current]
-
-            if current in visited:
-                continue
-
-            visited.add(current)
-
-            for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
-                neighbor = (current[0] + dx, current[1] + dy)
-
-                if (0 <= neighbor[0] < self.width and
-                        0 <= neighbor[1] < self.height and
-                        self.grid[neighbor[1]][neighbor[0]] not in [self.OBSTACLE, self.DYNAMIC_OBSTACLE]):
-
-                    tentative_g_score = g_score[current] + 1
-
-                    if neighbor not in g_score or tentative_g_score < g_score[neighbor]:
-                        g_score[neighbor] = tentative_g_score
-                        f_score = tentative_g_score + abs(neighbor[0] - target[0]) + abs(neighbor[1] - target[1])
-                        heapq.heappush(open_set, (f_score, neighbor, path + [current]))
-
-        return None
+        sx, sy = start
+        tx, ty = target
+
+        cache_key = (start, target, tuple(self.dynamic_obstacles))
+        cached = self._path_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        stride = self.width + 2
+        self._scratch_version += 1
+        parent = self._scratch_parent
+        goal = _astar_kernel(self._padded, self.width, self.height,
+                             sx, sy, tx, ty, parent,
+                             self._scratch_g, self._scratch_h,
+                             self._scratch_best, self._scratch_heap,
+                             self._scratch_stamp, self._scratch_version)
+        if goal < 0:
+            return None
+
+        # walking parent pointers back to the start
+        out = self._walk_out
+        length = _walk_parents(parent, (sy + 1) * stride + (sx + 1),
+                               goal, out)
+        path = [start] + [(nid % stride - 1, nid // stride - 1)
+                          for nid in out[:length].tolist()]
+        if len(self._path_cache) >= 256:
+            self._path_cache.clear()
+        self._path_cache[cache_key] = path
+        return path
 
     def find_most_efficient_path(self, robot_index):
         """
@@ -122,44 +284,70 @@ class RobotNavigation:
         """
         start = self.robot_positions[robot_index]
 
-        # If there's only one unvisited cell, find the direct path
-        if len(self.unvisited_cells) == 1:
-            target = next(iter(self.unvisited_cells))
-            return self.astar_pathfinding(start, target)
-
-        # Normal A* algorithm to find the most efficient path
-        open_set = []
-        heapq.heappush(open_set, (0, start, []))
-        visited = set([start])
-
-        while open_set:
-            priority, current, path = heapq.heappop(open_set)
-
-            for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
-                neighbor = (current[0] + dx, current[1] + dy)
-
-                if (0 <= neighbor[0] < self.width and
-                        0 <= neighbor[1] < self.height and
-                        self.grid[neighbor[1]][neighbor[0]] not in [self.OBSTACLE, self.DYNAMIC_OBSTACLE] and
-                        neighbor not in visited):
-
-                    new_path = path + [neighbor]
-
-                    if neighbor in self.unvisited_cells:
-                        return new_path
-
-                    visited.add(neighbor)
-
-                    unexplored_neighbors = sum(
-                        1 for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]
-                        if (0 <= neighbor[0] + dx < self.width and
-                            0 <= neighbor[1] + dy < self.height and
-                            self.grid[neighbor[1] + dy][neighbor[0] + dx] == self.UNVISITED)
-                    )
-                    priority = len(new_path) - unexplored_neighbors
-                    heapq.heappush(open_set, (priority, neighbor, new_path))
-
-        return None
+        # If there's only one unvisited cell, plan to it incrementally:
+        # the planner reuses its previous search and only repairs the
+        # nodes disturbed by dynamic obstacles between queries
+        if self.unvisited_count == 1:
+            nid = int(np.flatnonzero(self.unvisited_mask.ravel())[0])
+            target = (nid % self.width, nid // self.width)
+            planner = self._endgame_planner
+            if planner is None or planner.target_cell != target:
+                planner = LifelongAStar(self, target)
+                self._endgame_planner = planner
+            return planner.compute_shortest_path(start)
+
+        # Frontier search toward the nearest unvisited cell
+        sx, sy = start
+
+        cache_key = (start, self.unvisited_count,
+                     tuple(self.dynamic_obstacles))
+        cached = self._path_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        if self._unvis_nbr is None:
+            cnt = convolve2d(self.unvisited_mask.astype(np.int8),
+                             _NBR_KERNEL, mode='same', boundary='fill')
+            padded_cnt = np.zeros((self.height + 2, self.width + 2),
+                                  dtype=np.int8)
+            padded_cnt[1:-1, 1:-1] = cnt
+            self._unvis_nbr = padded_cnt.ravel()
+
+        stride = self.width + 2
+        self._scratch_version += 1
+        parent = self._scratch_parent
+        if self.width * self.height > 16384:
+            # large grids spill out of L1; process the frontier in 8x8
+            # tile blocks so expansions reuse cached lines
+            goal = _find_path_kernel_tiled(
+                self._padded, self.width, self.height, sx, sy,
+                self.unvisited_mask, self._unvis_nbr, parent,
+                self._scratch_visited, self._scratch_depth,
+                self._scratch_heap, self._scratch_stamp,
+                self._scratch_version, self._tile_head, self._tile_next,
+                self._tile_stamp)
+        else:
+            goal = _find_path_kernel(self._padded, self.width, self.height,
+                                     sx, sy, self.unvisited_mask,
+                                     self._unvis_nbr, parent,
+                                     self._scratch_visited,
+                                     self._scratch_depth,
+                                     self._scratch_heap,
+                                     self._scratch_stamp,
+                                     self._scratch_version)
+        if goal < 0:
+            return None
+
+        # walking parent pointers back to the start
+        out = self._walk_out
+        length = _walk_parents(parent, (sy + 1) * stride + (sx + 1),
+                               goal, out)
+        path = [(nid % stride - 1, nid // stride - 1)
+                for nid in out[:length].tolist()]
+        if len(self._path_cache) >= 256:
+            self._path_cache.clear()
+        self._path_cache[cache_key] = path
+        return path
 
     def move_robot(self, robot_index, path):
         """
@@ -169,17 +357,22 @@ class RobotNavigation:
             return False
 
         for x, y in path[:-1]:
-            if self.grid[y][x] == self.VISITED:
-                self.grid[y][x] = self.RETRACED_PATH
+            if self.grid[y, x] == self.VISITED:
+                self.grid[y, x] = self.RETRACED_PATH
+                self.dirty.add((x, y))
 
         x, y = path[-1]
-        self.grid[self.robot_positions[robot_index][1]][self.robot_positions[robot_index][0]] = self.VISITED
-        self.grid[y][x] = self.ROBOT
+        self.grid[self.robot_positions[robot_index][1], self.robot_positions[robot_index][0]] = self.VISITED
+        self.grid[y, x] = self.ROBOT
+        self.dirty.add(self.robot_positions[robot_index])
+        self.dirty.add((x, y))
 
         self.robot_positions[robot_index] = (x, y)
 
-        if (x, y) in self.unvisited_cells:
-            self.unvisited_cells.remove((x, y))
+        if self.unvisited_mask[y, x]:
+            self.unvisited_mask[y, x] = False
+            self.unvisited_count -= 1
+            self._unvis_nbr = None
         self.visited_cells.add((x, y))
 
         self.robot_paths[robot_index].append((x, y))  # track path
@@ -190,7 +383,7 @@ class RobotNavigation:
         """
         Check if entire grid is explored
         """
-        return not self.unvisited_cells
+        return self.unvisited_count == 0
 
 class GridVisualization:
     def __init__(self, width, height):
@@ -218,29 +411,62 @@ class GridVisualization:
             (255, 0, 255)  # Robot 2
         ]
 
+        # uint8 palette LUT so a full repaint is one fancy-index +
+        # blit_array instead of per-cell draw.rect calls
+        self.palette = np.zeros((max(self.COLORS) + 1, 3), dtype=np.uint8)
+        for state, color in self.COLORS.items():
+            self.palette[state] = color
+
+        # off-screen canvas holding the rendered grid; only dirty cells
+        # are repainted onto it after the first full draw
+        self.canvas = None
         self.screen = pygame.display.set_mode((self.SCREEN_WIDTH, self.SCREEN_HEIGHT))
         pygame.display.set_caption('Coverage Path Planning Grid')
 
+    def _full_repaint(self, robot_nav):
+        """
+        Paint every cell in one pass: map the uint8 grid through the
+        palette, expand to pixels and blit the whole block at once.
+        """
+        cs = self.CELL_SIZE
+        rgb = self.palette[robot_nav.grid]
+        big = np.repeat(np.repeat(rgb, cs, axis=0), cs, axis=1)
+        pygame.surfarray.blit_array(self.canvas, big.swapaxes(0, 1))
+        # cell borders as one line per row/column
+        black = (0, 0, 0)
+        for x in range(robot_nav.width + 1):
+            px = min(x * cs, self.SCREEN_WIDTH - 1)
+            pygame.draw.line(self.canvas, black, (px, 0),
+                             (px, self.SCREEN_HEIGHT - 1))
+        for y in range(robot_nav.height + 1):
+            py = min(y * cs, self.SCREEN_HEIGHT - 1)
+            pygame.draw.line(self.canvas, black, (0, py),
+                             (self.SCREEN_WIDTH - 1, py))
+
     def draw_grid(self, robot_nav):
-        for y in range(robot_nav.height):
-            for x in range(robot_nav.width):
-                rect = pygame.Rect(
-                    x * self.CELL_SIZE,
-                    y * self.CELL_SIZE,
-                    self.CELL_SIZE,
-                    self.CELL_SIZE
-                )
-                pygame.draw.rect(
-                    self.screen,
-                    self.COLORS[robot_nav.grid[y][x]],
-                    rect
-                )
-                pygame.draw.rect(
-                    self.screen,
-                    (0, 0, 0),
-                    rect,
-                    1
-                )
+        if self.canvas is None:
+            self.canvas = pygame.Surface((self.SCREEN_WIDTH, self.SCREEN_HEIGHT))
+            self._full_repaint(robot_nav)
+        for x, y in robot_nav.dirty:
+            rect = pygame.Rect(
+                x * self.CELL_SIZE,
+                y * self.CELL_SIZE,
+                self.CELL_SIZE,
+                self.CELL_SIZE
+            )
+            pygame.draw.rect(
+                self.canvas,
+                self.COLORS[robot_nav.grid[y, x]],
+                rect
+            )
+            pygame.draw.rect(
+                self.canvas,
+                (0, 0, 0),
+                rect,
+                1
+            )
+        robot_nav.dirty.clear()
+        self.screen.blit(self.canvas, (0, 0))
 
         # Draw robot paths
         for robot_index, path in robot_nav.robot_paths.items():
@@ -1,6 +1,133 @@
+import itertools
+
 import pygame
 import random
-import heapq
+import numpy as np
+from numba import njit
+
+# cell states are numbered so bit 0 means "blocked": obstacles get the
+# odd codes, so blocking checks reduce to a single branchless `& 1`
+_BLOCKED = 1
+
+# all 24 orderings of the four directions, so picking a random visit
+# order is a single randrange instead of shuffling a fresh list
+_DIRS = ((0, 1), (1, 0), (0, -1), (-1, 0))
+_PERMS = tuple(itertools.permutations(range(4)))
+
+
+@njit(cache=True)
+def _astar(grid_flat, nbr, sx, sy, tx, ty, width, came_from, g_score, heap,
+           h_cache, gen, gen_id):
+    """
+    JIT-compiled A* core over flat y*width+x node indices.
+
+    `nbr` is the precomputed (n, 4) neighbor-index table (-1 = off
+    grid), so expansions skip the per-neighbor bounds arithmetic.
+    `heap` is a preallocated (cap, 2) int32 array of (f_score, node)
+    rows managed with manual sift-up/down, since heapq is unavailable
+    under nopython mode. Returns the target index when reached or -1;
+    the route is left behind in `came_from`.
+    """
+    start = sy * width + sx
+    target = ty * width + tx
+    gen[start] = gen_id
+    g_score[start] = 0
+    came_from[start] = -1
+    h_cache[start] = abs(sx - tx) + abs(sy - ty)
+    heap[0, 0] = h_cache[start]
+    heap[0, 1] = start
+    heap_len = 1
+
+    while heap_len > 0:
+        f = heap[0, 0]
+        current = heap[0, 1]
+        # remove the root and sift the last row down into its place
+        heap_len -= 1
+        mf = heap[heap_len, 0]
+        mn = heap[heap_len, 1]
+        i = 0
+        while True:
+            child = 2 * i + 1
+            if child >= heap_len:
+                break
+            if child + 1 < heap_len and heap[child + 1, 0] < heap[child, 0]:
+                child += 1
+            if heap[child, 0] >= mf:
+                break
+            heap[i, 0] = heap[child, 0]
+            heap[i, 1] = heap[child, 1]
+            i = child
+        heap[i, 0] = mf
+        heap[i, 1] = mn
+
+        if current == target:
+            return current
+        cg = g_score[current]
+        if f - h_cache[current] > cg:
+            continue  # stale entry superseded by a cheaper push
+
+        for k in range(4):
+            nid = nbr[current, k]
+            if nid < 0:
+                continue
+            if grid_flat[nid] & _BLOCKED:
+                continue
+            if gen[nid] != gen_id:
+                # first touch this search: lazily reset the reused slot
+                # and memoize the heuristic while the coords are at hand
+                gen[nid] = gen_id
+                g_score[nid] = 1 << 30
+                h_cache[nid] = abs(nid % width - tx) + abs(nid // width - ty)
+            tentative = cg + 1
+            if tentative < g_score[nid]:
+                g_score[nid] = tentative
+                came_from[nid] = current
+                nf = tentative + h_cache[nid]
+                # sift-up insert
+                j = heap_len
+                heap_len += 1
+                while j > 0:
+                    p = (j - 1) >> 1
+                    if heap[p, 0] <= nf:
+                        break
+                    heap[j, 0] = heap[p, 0]
+                    heap[j, 1] = heap[p, 1]
+                    j = p
+                heap[j, 0] = nf
+                heap[j, 1] = nid
+    return -1
+
+
+@njit(cache=True)
+def _coverage_field(grid_flat, nbr, visited, dist, parent, queue):
+    """
+    JIT-compiled multi-source BFS: seeds every reachable unvisited
+    cell at distance 0 and fills dist/parent outward through
+    unblocked cells. `queue` is a preallocated int32 ring used as a
+    flat FIFO, since deque is unavailable under nopython mode.
+    """
+    tail = 0
+    for idx in range(grid_flat.shape[0]):
+        if visited[idx] == 0 and (grid_flat[idx] & _BLOCKED) == 0:
+            dist[idx] = 0
+            queue[tail] = idx
+            tail += 1
+        else:
+            dist[idx] = -1
+
+    head = 0
+    while head < tail:
+        current = queue[head]
+        head += 1
+        d = dist[current] + 1
+        for k in range(4):
+            n = nbr[current, k]
+            if n >= 0 and dist[n] < 0 and (grid_flat[n] & _BLOCKED) == 0:
+                dist[n] = d
+                parent[n] = current
+                queue[tail] = n
+                tail += 1
+
 
 class RobotNavigation:
     def __init__(self, width, height, obstacles):
@@ -9,102 +136,144 @@ class RobotNavigation:
         """
         self.width = width
         self.height = height
-        self.grid = [[0 for _ in range(width)] for _ in range(height)]
+        self.grid = np.zeros((height, width), dtype=np.uint8)
 
         self.UNVISITED = 0
-        self.VISITED = 1
-        self.OBSTACLE = 2
-        self.ROBOT = 3
+        self.OBSTACLE = 1
+        self.VISITED = 2
+        self.DYNAMIC_OBSTACLE = 3
         self.RETRACED_PATH = 4
-        self.DYNAMIC_OBSTACLE = 5
+        self.ROBOT = 6
 
         self.robot_pos = [0, 0]
-        self.visited_cells = set([(0, 0)])
-        self.unvisited_cells = set((x, y) for x in range(width)
-                                    for y in range(height)
-                                    if (x, y) != (0, 0))
+        # per-cell visited bitmap plus a scalar count of what is left:
+        # O(1) membership and completion checks without tuple hashing
+        self.visited = np.zeros(width * height, dtype=np.uint8)
+        self.visited[0] = 1
+        self.unvisited_count = width * height - 1
 
         # for static obstacles
         for x, y in obstacles:
-            self.grid[y][x] = self.OBSTACLE
-            if (x, y) in self.unvisited_cells:
-                self.unvisited_cells.remove((x, y))
+            if self.grid[y, x] != self.OBSTACLE:
+                self.grid[y, x] = self.OBSTACLE
+                if not self.visited[y * width + x]:
+                    self.unvisited_count -= 1
 
         # for dynamic obstacles
         self.dynamic_obstacles = []
         for _ in range(5):
             while True:
                 obstacle = [random.randint(0, width - 1), random.randint(0, height - 1)]
-                if self.grid[obstacle[1]][obstacle[0]] == self.UNVISITED:
-                    self.grid[obstacle[1]][obstacle[0]] = self.DYNAMIC_OBSTACLE
+                if self.grid[obstacle[1], obstacle[0]] == self.UNVISITED:
+                    self.grid[obstacle[1], obstacle[0]] = self.DYNAMIC_OBSTACLE
                     self.dynamic_obstacles.append(obstacle)
                     break
 
         # initial position
-        self.grid[0][0] = self.ROBOT
+        self.grid[0, 0] = self.ROBOT
+
+        # cells whose state changed since the last repaint
+        self.dirty = set()
+
+        # last computed path, reused on the next tick unless an
+        # obstacle stepped onto it or the robot moved off its start
+        self._path_cache = None
+        self._path_cells = ()
+        self._path_start = None
+        self._path_invalid = False
+        self._path_blocked = False
+
+        # 4-neighbor index table in (0,1),(1,0),(0,-1),(-1,0) order;
+        # -1 marks off-grid, so expansions need no bounds checks
+        n = width * height
+        nbr = np.full((n, 4), -1, dtype=np.int32)
+        for y in range(height):
+            for x in range(width):
+                idx = y * width + x
+                if y + 1 < height:
+                    nbr[idx, 0] = idx + width
+                if x + 1 < width:
+                    nbr[idx, 1] = idx + 1
+                if y > 0:
+                    nbr[idx, 2] = idx - width
+                if x > 0:
+                    nbr[idx, 3] = idx - 1
+        self.neighbors = nbr
+
+        # reusable pathfinding buffers: bumping the generation id resets
+        # the per-node entries in O(1) instead of refilling the arrays
+        self._came = np.empty(n, dtype=np.int32)
+        self._g = np.empty(n, dtype=np.int32)
+        self._h = np.empty(n, dtype=np.int32)
+        self._heap = np.empty((4 * n + 1, 2), dtype=np.int32)
+        self._gen = np.zeros(n, dtype=np.int32)
+        self._gen_id = 0
+
+        # coverage field from the multi-source BFS: dist/parent toward
+        # the nearest unvisited cell, valid until the world changes
+        self._dist = np.empty(n, dtype=np.int32)
+        self._parent = np.empty(n, dtype=np.int32)
+        self._queue = np.empty(n, dtype=np.int32)
+        self._field_valid = False
 
     def move_dynamic_obstacles(self):
         """
         Move the dynamic obstacles randomly but not blocking essential paths
         """
+        if self.dynamic_obstacles:
+            self._field_valid = False
+
         for i, obstacle in enumerate(self.dynamic_obstacles):
             x, y = obstacle
 
+            self.dirty.add((x, y))
+
             # cell state updation
-            if (x, y) in self.visited_cells:
-                self.grid[y][x] = self.VISITED
-            elif (x, y) not in self.unvisited_cells:
-                self.grid[y][x] = self.RETRACED_PATH
+            if self.visited[y * self.width + x]:
+                self.grid[y, x] = self.VISITED
             else:
-                self.grid[y][x] = self.UNVISITED
+                self.grid[y, x] = self.UNVISITED
 
             # direction locator
-            directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]
-            random.shuffle(directions)
-            for dx, dy in directions:
+            for k in _PERMS[random.randrange(24)]:
+                dx, dy = _DIRS[k]
                 new_x, new_y = x + dx, y + dy
                 if (0 <= new_x < self.width and
                         0 <= new_y < self.height and
-                        self.grid[new_y][new_x] in [self.UNVISITED, self.VISITED, self.RETRACED_PATH] and
-                        self.grid[new_y][new_x] != self.ROBOT):  # collision avoidance
+                        (self.grid[new_y, new_x] & 1) == 0 and
+                        self.grid[new_y, new_x] != self.ROBOT):  # collision avoidance
                     self.dynamic_obstacles[i] = [new_x, new_y]
-                    self.grid[new_y][new_x] = self.DYNAMIC_OBSTACLE
+                    self.grid[new_y, new_x] = self.DYNAMIC_OBSTACLE
+                    self.dirty.add((new_x, new_y))
+                    if (new_x, new_y) in self._path_cells:
+                        self._path_invalid = True
+                        self._path_blocked = True
                     break
 
     def astar_pathfinding(self, start, target):
         """
         A* pathfinding algorithm to find the shortest path from start to target
         """
-        open_set = []
-        heapq.heappush(open_set, (0, start, []))
-        g_score = {start: 0}
-        visited = set()
-
-        while open_set:
-            _, current, path = heapq.heappop(open_set)
-
-            if current == target:
-                return path + [current]
-
-            if current in visited:
-                continue
-
-            visited.add(current)
-
-            for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
-                neighbor = (current[0] + dx, current[1] + dy)
-
-                if (0 <= neighbor[0] < self.width and
-                        0 <= neighbor[1] < self.height and
-                        self.grid[neighbor[1]][neighbor[0]] not in [self.OBSTACLE, self.DYNAMIC_OBSTACLE]):
-
-                    tentative_g_score = g_score[current] + 1
-                    if neighbor not in g_score or tentative_g_score < g_score[neighbor]:
-                        g_score[neighbor] = tentative_g_score
-                        f_score = tentative_g_score + abs(neighbor[0] - target[0]) + abs(neighbor[1] - target[1])
-                        heapq.heappush(open_set, (f_score, neighbor, path + [current]))
-
-        return None
+        width = self.width
+        self._gen_id += 1
+        came_from = self._came
+
+        goal = _astar(self.grid.ravel(), self.neighbors,
+                      start[0], start[1], target[0], target[1],
+                      width, came_from, self._g, self._heap,
+                      self._h, self._gen, self._gen_id)
+        if goal < 0:
+            return None
+
+        # walk the came_from chain once instead of copying the
+        # partial path on every push
+        path = []
+        idx = goal
+        while idx != -1:
+            path.append((idx % width, idx // width))
+            idx = came_from[idx]
+        path.reverse()
+        return path
 
     def find_most_efficient_path(self):
         """
@@ -112,42 +281,62 @@ class RobotNavigation:
         """
         start = tuple(self.robot_pos)
 
+        cached = self._path_cache
+        if (cached is not None and not self._path_invalid and
+                start == self._path_start and
+                not self.visited[cached[-1][1] * self.width + cached[-1][0]]):
+            return cached
+
         # If there's only one unvisited cell, find the direct path
-        if len(self.unvisited_cells) == 1:
-            target = next(iter(self.unvisited_cells))
-            return self.astar_pathfinding(start, target)
-
-        # Normal A* algorithm to find the most efficient path
-        open_set = []
-        heapq.heappush(open_set, (0, start, []))
-        visited = set([start])
-
-        while open_set:
-            priority, current, path = heapq.heappop(open_set)
-
-            for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
-                neighbor = (current[0] + dx, current[1] + dy)
-
-                if (0 <= neighbor[0] < self.width and
-                        0 <= neighbor[1] < self.height and
-                        self.grid[neighbor[1]][neighbor[0]] not in [self.OBSTACLE, self.DYNAMIC_OBSTACLE] and
-                        neighbor not in visited):
-
-                    new_path = path + [neighbor]
-                    if neighbor in self.unvisited_cells:
-                        return new_path
-
-                    visited.add(neighbor)
-                    unexplored_neighbors = sum(
-                        1 for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]
-                        if (0 <= neighbor[0] + dx < self.width and
-                            0 <= neighbor[1] + dy < self.height and
-                            self.grid[neighbor[1] + dy][neighbor[0] + dx] == self.UNVISITED)
-                    )
-                    priority = len(new_path) - unexplored_neighbors
-                    heapq.heappush(open_set, (priority, neighbor, new_path))
-
-        return None
+        if self.unvisited_count == 1:
+            idx = int(np.flatnonzero((self.visited == 0) &
+                                     (self.grid.ravel() != self.OBSTACLE))[0])
+            target = (idx % self.width, idx // self.width)
+            return self._remember_path(start, self.astar_pathfinding(start, target))
+
+        # One reversed BFS from every unvisited cell answers "nearest
+        # unvisited target" for any robot position; reuse the field
+        # until the frontier or the obstacles change
+        width = self.width
+        start_idx = start[1] * width + start[0]
+
+        if not self._field_valid:
+            self._compute_coverage_field()
+        dist = self._dist
+        if dist[start_idx] < 0:
+            return None
+
+        # follow parents downhill to the nearest unvisited cell; the
+        # start cell is dropped to keep the first-step-first layout
+        parent = self._parent
+        path = []
+        idx = start_idx
+        while dist[idx] > 0:
+            idx = parent[idx]
+            path.append((idx % width, idx // width))
+        return self._remember_path(start, path)
+
+    def _compute_coverage_field(self):
+        """
+        Multi-source BFS outward from every reachable unvisited cell;
+        parent then points one step closer to the nearest target
+        """
+        _coverage_field(self.grid.ravel(), self.neighbors, self.visited,
+                        self._dist, self._parent, self._queue)
+        self._field_valid = True
+
+    def _remember_path(self, start, path):
+        """
+        Cache a freshly computed path for reuse on unchanged ticks
+        """
+        self._path_cache = path
+        self._path_cells = set(path) if path else ()
+        self._path_start = start
+        self._path_invalid = False
+        # a fresh plan routes around obstacles, so any blocked flag
+        # raised against the old cached path no longer applies
+        self._path_blocked = False
+        return path
 
     def move_robot(self, path):
         """
@@ -157,18 +346,28 @@ class RobotNavigation:
             return False
 
         for x, y in path[:-1]:
-            if self.grid[y][x] == self.VISITED:
-                self.grid[y][x] = self.RETRACED_PATH
+            if self.grid[y, x] == self.VISITED:
+                self.grid[y, x] = self.RETRACED_PATH
+                self.dirty.add((x, y))
 
         x, y = path[-1]
-        self.grid[self.robot_pos[1]][self.robot_pos[0]] = self.VISITED
-        self.grid[y][x] = self.ROBOT
+        self.grid[self.robot_pos[1], self.robot_pos[0]] = self.VISITED
+        self.grid[y, x] = self.ROBOT
+        self.dirty.add(tuple(self.robot_pos))
+        self.dirty.add((x, y))
 
         self.robot_pos = [x, y]
 
-        if (x, y) in self.unvisited_cells:
-            self.unvisited_cells.remove((x, y))
-        self.visited_cells.add((x, y))
+        # this move consumes whatever path was cached
+        self._path_cache = None
+        self._path_cells = ()
+        self._path_blocked = False
+
+        idx = y * self.width + x
+        if not self.visited[idx]:
+            self.visited[idx] = 1
+            self.unvisited_count -= 1
+            self._field_valid = False
 
         return True
 
@@ -176,7 +375,7 @@ class RobotNavigation:
         """
         Check if entire grid is explored
         """
-        return not self.unvisited_cells
+        return self.unvisited_count == 0
 
 class GridVisualization:
     def __init__(self, width, height):
@@ -191,36 +390,67 @@ class GridVisualization:
 
         self.COLORS = {
             0: (255, 255, 255),
-            1: (200, 255, 200),
-            2: (100, 100, 100),
-            3: (0, 0, 255),
+            1: (100, 100, 100),
+            2: (200, 255, 200),
+            3: (255, 0, 0),
             4: (255, 255, 0),
-            5: (255, 0, 0)
+            6: (0, 0, 255)
         }
 
         self.screen = pygame.display.set_mode((self.SCREEN_WIDTH, self.SCREEN_HEIGHT))
         pygame.display.set_caption('Coverage Path Planning Grid')
 
-    def draw_grid(self, robot_nav):
-        for y in range(robot_nav.height):
-            for x in range(robot_nav.width):
-                rect = pygame.Rect(
-                    x * self.CELL_SIZE,
-                    y * self.CELL_SIZE,
-                    self.CELL_SIZE,
-                    self.CELL_SIZE
-                )
-                pygame.draw.rect(
-                    self.screen,
-                    self.COLORS[robot_nav.grid[y][x]],
-                    rect
-                )
+        # one pre-rendered tile per cell state with the border baked in,
+        # so drawing a cell is a single blit instead of two draw.rect calls
+        self.tiles = {}
+        for state, color in self.COLORS.items():
+            tile = pygame.Surface((self.CELL_SIZE, self.CELL_SIZE))
+            tile.fill(color)
+            pygame.draw.rect(tile, (0, 0, 0), tile.get_rect(), 1)
+            self.tiles[state] = tile.convert()
+
+        # all cell borders on one colorkeyed overlay: a full repaint
+        # fills color runs and restores the borders with a single blit
+        overlay = pygame.Surface((self.SCREEN_WIDTH, self.SCREEN_HEIGHT))
+        overlay.fill((255, 0, 255))
+        for y in range(height):
+            for x in range(width):
                 pygame.draw.rect(
-                    self.screen,
-                    (0, 0, 0),
-                    rect,
-                    1
-                )
+                    overlay, (0, 0, 0),
+                    (x * self.CELL_SIZE, y * self.CELL_SIZE,
+                     self.CELL_SIZE, self.CELL_SIZE), 1)
+        overlay = overlay.convert()
+        overlay.set_colorkey((255, 0, 255))
+        self.border_overlay = overlay
+
+    def draw_grid(self, robot_nav, dirty=None):
+        # bind the per-cell lookups once; the loop body is then pure
+        # local loads instead of repeated attribute chains
+        cell_size = self.CELL_SIZE
+        tiles = self.tiles
+        grid = robot_nav.grid
+        blit = self.screen.blit
+        if dirty is not None:
+            # repaint only the cells that changed since the last frame
+            for x, y in dirty:
+                blit(tiles[grid[y, x]], (x * cell_size, y * cell_size))
+            return
+
+        # full repaint: one fill per horizontal run of equal state
+        # instead of a Python-level blit per cell
+        colors = self.COLORS
+        fill = self.screen.fill
+        width = robot_nav.width
+        for y in range(robot_nav.height):
+            row = grid[y]
+            breaks = np.flatnonzero(row[1:] != row[:-1]) + 1
+            x0 = 0
+            for x1 in breaks.tolist() + [width]:
+                fill(colors[row[x0]],
+                     (x0 * cell_size, y * cell_size,
+                      (x1 - x0) * cell_size, cell_size))
+                x0 = x1
+        blit(self.border_overlay, (0, 0))
 
     def draw_path(self, path, robot_nav):
         if len(path) > 1:
@@ -247,19 +477,27 @@ def run_simulation(width, height, obstacles):
     dynamic_obstacle_delay = 800
     waiting_time = 1000  # Time to wait when encountering a dynamic obstacle (in ms)
 
-    last_robot_move = pygame.time.get_ticks()
-    last_obstacle_move = pygame.time.get_ticks()
+    # hoist the per-frame attribute lookups out of the loop
+    get_ticks = pygame.time.get_ticks
+    get_events = pygame.event.get
+    flip = pygame.display.flip
+    move_dyn = robot_nav.move_dynamic_obstacles
+    find_path = robot_nav.find_most_efficient_path
+    move_robot = robot_nav.move_robot
+
+    last_robot_move = get_ticks()
+    last_obstacle_move = get_ticks()
     waiting_start_time = None  # Track when the robot starts waiting
 
     while running:
-        for event in pygame.event.get():
+        for event in get_events():
             if event.type == pygame.QUIT:
                 running = False
 
-        current_time = pygame.time.get_ticks()
+        current_time = get_ticks()
 
         if current_time - last_obstacle_move > dynamic_obstacle_delay:
-            robot_nav.move_dynamic_obstacles()
+            move_dyn()
             last_obstacle_move = current_time
 
         # Check if the robot is waiting
@@ -267,37 +505,33 @@ def run_simulation(width, height, obstacles):
             if current_time - waiting_start_time >= waiting_time:
                 waiting_start_time = None  # Robot stops waiting after enough time
             else:
-                # Skip robot movement while waiting
-                visualization.screen.fill((255, 255, 255))
+                # Skip robot movement while waiting; the grid
+                # repaint covers the window, no background fill needed
                 visualization.draw_grid(robot_nav)
                 visualization.draw_path(path_traveled, robot_nav)
-                pygame.display.flip()
+                flip()
                 clock.tick(60)
                 continue
 
         if current_time - last_robot_move > robot_delay:
-            path = robot_nav.find_most_efficient_path()
+            path = find_path()
 
             if path:
-                # Check if a dynamic obstacle is blocking the path
-                blocked = False
-                for x, y in path:
-                    if robot_nav.grid[y][x] == robot_nav.DYNAMIC_OBSTACLE:
-                        blocked = True
-                        break
-
-                if blocked:
+                # an obstacle stepping onto the active path raises this
+                # flag, replacing the O(path) rescan every tick
+                if robot_nav._path_blocked:
+                    robot_nav._path_blocked = False
                     # Start waiting if the path is blocked
                     if not waiting_start_time:
                         waiting_start_time = current_time
                 else:
                     # Move the robot if the path is clear
-                    robot_nav.move_robot(path)
+                    move_robot(path)
                     path_traveled.extend(path)
 
             if robot_nav.is_exploration_complete():
                 # Mark the robot's final position as visited and let it rest there
-                robot_nav.grid[robot_nav.robot_pos[1]][robot_nav.robot_pos[0]] = robot_nav.ROBOT
+                robot_nav.grid[robot_nav.robot_pos[1], robot_nav.robot_pos[0]] = robot_nav.ROBOT
                 print("Grid fully explored!")
                 visualization.screen.fill((255, 255, 255))
                 visualization.draw_grid(robot_nav)
@@ -309,10 +543,11 @@ def run_simulation(width, height, obstacles):
 
             last_robot_move = current_time
 
-        visualization.screen.fill((255, 255, 255))
         visualization.draw_grid(robot_nav)
         visualization.draw_path(path_traveled, robot_nav)
-        pygame.display.flip()
+        flip()
+        # the full repaint above covers every pending dirty cell
+        robot_nav.dirty.clear()
 
         clock.tick(60)
 
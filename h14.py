@@ -1,6 +1,9 @@
 import pygame
 import random
-import heapq
+from collections import deque
+
+# 4-neighborhood offsets, built once instead of per loop iteration
+_DIRS = ((0, 1), (1, 0), (0, -1), (-1, 0))
 
 class RobotNavigation:
     def __init__(self, width, height, obstacles):
@@ -9,7 +12,8 @@ class RobotNavigation:
         """
         self.width = width
         self.height = height
-        self.grid = [[0 for _ in range(width)] for _ in range(height)]
+        # flat bytearray grid: contiguous byte per cell, indexed y*W+x
+        self.grid = bytearray(width * height)
         
         # Cell states
         self.UNVISITED = 0
@@ -22,103 +26,126 @@ class RobotNavigation:
         # Robot navigation values
         self.robot_pos = [0, 0]
         self.visited_cells = set([(0, 0)])
-        self.unvisited_cells = set((x, y) for x in range(width) 
-                                   for y in range(height) 
-                                   if (x, y) != (0, 0))
-        
-        # Place static obstacles
-        for x, y in obstacles:
-            self.grid[y][x] = self.OBSTACLE
-            if (x, y) in self.unvisited_cells:
-                self.unvisited_cells.remove((x, y))
+        # Set comprehension plus one batch removal of the start cell
+        # and the obstacles, instead of filtering inside a generator
+        self.unvisited_cells = {(x, y) for y in range(height)
+                                       for x in range(width)}
+        obstacle_set = set(map(tuple, obstacles))
+        self.unvisited_cells.difference_update(obstacle_set)
+        self.unvisited_cells.discard((0, 0))
+
+        # Place static obstacles, deduplicated so repeated input
+        # coordinates cost one write each
+        for x, y in obstacle_set:
+            self.grid[y * width + x] = self.OBSTACLE
         
-        # Place dynamic obstacles
+        # Place dynamic obstacles on cells sampled from the free list
+        # in one pass instead of rejection-probing random coordinates,
+        # remembering the state of the cell each one covers so
+        # restoring it is a single grid write
+        free = [i for i, v in enumerate(self.grid) if v == self.UNVISITED]
         self.dynamic_obstacles = []
-        for _ in range(3):  # Add 3 dynamic obstacles
-            while True:
-                obstacle = [random.randint(0, width - 1), random.randint(0, height - 1)]
-                if self.grid[obstacle[1]][obstacle[0]] == self.UNVISITED:
-                    self.grid[obstacle[1]][obstacle[0]] = self.DYNAMIC_OBSTACLE
-                    self.dynamic_obstacles.append(obstacle)
-                    break
+        self._prev_state = []
+        for idx in random.sample(free, 3):  # Add 3 dynamic obstacles
+            self.grid[idx] = self.DYNAMIC_OBSTACLE
+            self.dynamic_obstacles.append([idx % width, idx // width])
+            self._prev_state.append(self.UNVISITED)
         
         # Mark initial robot position
-        self.grid[0][0] = self.ROBOT
-    
+        self.grid[0] = self.ROBOT
+
+        # Reused by find_most_efficient_path so each search refills
+        # one list instead of allocating a fresh one per tick
+        self._path_buf = []
+
     def move_dynamic_obstacles(self):
         """
         Move the dynamic obstacles randomly but not blocking essential paths
         """
+        width = self.width
+        height = self.height
+        grid = self.grid
+        prev_state = self._prev_state
+        UNVISITED, VISITED = self.UNVISITED, self.VISITED
+        RETRACED, DYNAMIC = self.RETRACED_PATH, self.DYNAMIC_OBSTACLE
+        sample = random.sample
+
         for i, obstacle in enumerate(self.dynamic_obstacles):
             x, y = obstacle
-            
+
             # Restore the cell's previous state before moving the obstacle
-            if (x, y) in self.visited_cells:
-                self.grid[y][x] = self.VISITED
-            elif (x, y) not in self.unvisited_cells:
-                self.grid[y][x] = self.RETRACED_PATH
-            else:
-                self.grid[y][x] = self.UNVISITED
-            
+            grid[y * width + x] = prev_state[i]
+
             # Choose a random valid direction
-            directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]
-            random.shuffle(directions)
-            for dx, dy in directions:
+            for dx, dy in sample(_DIRS, 4):
                 new_x, new_y = x + dx, y + dy
-                if (0 <= new_x < self.width and 
-                    0 <= new_y < self.height and 
-                    self.grid[new_y][new_x] in [self.UNVISITED, self.VISITED, self.RETRACED_PATH] and
-                    self.grid[new_y][new_x] != self.ROBOT):  # Prevent obstacles from overlapping robot
+                if not ((new_x | new_y) >= 0 and
+                        new_x < width and new_y < height):
+                    continue
+                # Only free cells qualify, which also keeps obstacles
+                # off the robot
+                v = grid[new_y * width + new_x]
+                if v == UNVISITED or v == VISITED or v == RETRACED:
                     # Move obstacle
                     self.dynamic_obstacles[i] = [new_x, new_y]
-                    self.grid[new_y][new_x] = self.DYNAMIC_OBSTACLE
+                    prev_state[i] = v
+                    grid[new_y * width + new_x] = DYNAMIC
                     break
 
     def find_most_efficient_path(self):
         """
         Find the most efficient path to an unvisited cell
         """
-        start = tuple(self.robot_pos)
-        
-        # Priority queue for efficient path finding
-        open_set = []
-        heapq.heappush(open_set, (0, start, []))
-        visited = set([start])
-        
-        while open_set:
-            priority, current, path = heapq.heappop(open_set)
-            
+        width = self.width
+        height = self.height
+        grid = self.grid
+        UNVISITED = self.UNVISITED
+        OBSTACLE, DYNAMIC = self.OBSTACLE, self.DYNAMIC_OBSTACLE
+        start_idx = self.robot_pos[1] * width + self.robot_pos[0]
+
+        # Plain BFS over the flat grid: on a uniform-cost lattice the
+        # first unvisited cell reached is the nearest one, so no heap
+        # is needed. parent doubles as the seen-mark (-1 = unseen)
+        parent = [-1] * (width * height)
+        parent[start_idx] = start_idx
+        queue = deque([start_idx])
+        push = queue.append
+        popleft = queue.popleft
+
+        while queue:
+            current = popleft()
+            cx = current % width
+            cy = current // width
+
             # Check neighboring cells for unvisited cells
-            for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
-                neighbor = (current[0] + dx, current[1] + dy)
-                
-                # Check grid boundaries and obstacles
-                if (0 <= neighbor[0] < self.width and 
-                    0 <= neighbor[1] < self.height and 
-                    self.grid[neighbor[1]][neighbor[0]] not in [self.OBSTACLE, self.DYNAMIC_OBSTACLE] and
-                    neighbor not in visited):
-                    
-                    new_path = path + [neighbor]
-                    
-                    # If unvisited cell found, return path
-                    if neighbor in self.unvisited_cells:
-                        return new_path
-                    
-                    # Add to exploration queue
-                    visited.add(neighbor)
-                    
-                    # Priority based on distance and unexplored neighbors
-                    unexplored_neighbors = sum(
-                        1 for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]
-                        if (0 <= neighbor[0]+dx < self.width and 
-                            0 <= neighbor[1]+dy < self.height and 
-                            self.grid[neighbor[1]+dy][neighbor[0]+dx] == self.UNVISITED)
-                    )
-                    
-                    # Update priority based on distance and unexplored neighbors
-                    priority = len(new_path) - unexplored_neighbors
-                    heapq.heappush(open_set, (priority, neighbor, new_path))
-        
+            for dx, dy in _DIRS:
+                nx, ny = cx + dx, cy + dy
+                # (nx | ny) is negative iff either coordinate is, so
+                # one sign test replaces the two lower-bound checks
+                if not ((nx | ny) >= 0 and nx < width and ny < height):
+                    continue
+                neighbor = ny * width + nx
+                v = grid[neighbor]
+                if (parent[neighbor] != -1 or
+                        v == OBSTACLE or v == DYNAMIC):
+                    continue
+
+                parent[neighbor] = current
+
+                # Unblocked cells read UNVISITED exactly when they
+                # are still uncovered; walk the parents back once
+                if v == UNVISITED:
+                    path = self._path_buf
+                    del path[:]
+                    idx = neighbor
+                    while idx != start_idx:
+                        path.append((idx % width, idx // width))
+                        idx = parent[idx]
+                    path.reverse()
+                    return path
+
+                push(neighbor)
+
         return None
 
 
@@ -131,22 +158,21 @@ class RobotNavigation:
         
         # Retrace path coloring
         for x, y in path[:-1]:
-            if self.grid[y][x] == self.VISITED:
-                self.grid[y][x] = self.RETRACED_PATH
+            if self.grid[y * self.width + x] == self.VISITED:
+                self.grid[y * self.width + x] = self.RETRACED_PATH
         
         # Move to final cell
         x, y = path[-1]
-        
+
         # Update grid
-        self.grid[self.robot_pos[1]][self.robot_pos[0]] = self.VISITED
-        self.grid[y][x] = self.ROBOT
+        self.grid[self.robot_pos[1] * self.width + self.robot_pos[0]] = self.VISITED
+        self.grid[y * self.width + x] = self.ROBOT
         
         # Update robot position
         self.robot_pos = [x, y]
         
         # Update visited and unvisited cells
-        if (x, y) in self.unvisited_cells:
-            self.unvisited_cells.remove((x, y))
+        self.unvisited_cells.discard((x, y))
         self.visited_cells.add((x, y))
         
         return True
@@ -155,9 +181,9 @@ class RobotNavigation:
         """
         Check if entire grid is explored
         """
-        return len(self.unvisited_cells) == 0 and all(
-            cell != self.UNVISITED for row in self.grid for cell in row
-        )
+        # unvisited_cells is maintained alongside every grid write, so
+        # no grid scan is needed
+        return not self.unvisited_cells
 
 class GridVisualization:
     def __init__(self, width, height):
@@ -184,36 +210,66 @@ class GridVisualization:
         # Create screen
         self.screen = pygame.display.set_mode((self.SCREEN_WIDTH, self.SCREEN_HEIGHT))
         pygame.display.set_caption('Efficient Robot Grid Navigation')
-    
+
+        # Pre-render one tile per cell state with the border baked in,
+        # so each cell is a single blit instead of two draw.rect calls
+        self._cell_surfs = {}
+        for state, color in self.COLORS.items():
+            surf = pygame.Surface((self.CELL_SIZE, self.CELL_SIZE))
+            surf.fill(color)
+            pygame.draw.rect(surf, (0, 0, 0), surf.get_rect(), 1)
+            self._cell_surfs[state] = surf.convert()
+
+        # Snapshot of the grid as last drawn, plus the cells the path
+        # lines crossed, so only changed cells are repainted
+        self._prev_grid = None
+        self._path_cells = set()
+
     def draw_grid(self, robot_nav):
         """
         Render grid state
+
+        Returns the list of repainted cell rects, or None on the first
+        call when the whole grid is drawn (caller should flip).
         """
-        for y in range(robot_nav.height):
-            for x in range(robot_nav.width):
-                rect = pygame.Rect(
-                    x * self.CELL_SIZE, 
-                    y * self.CELL_SIZE, 
-                    self.CELL_SIZE, 
-                    self.CELL_SIZE
-                )
-                pygame.draw.rect(
-                    self.screen, 
-                    self.COLORS[robot_nav.grid[y][x]], 
-                    rect
-                )
-                pygame.draw.rect(
-                    self.screen, 
-                    (0, 0, 0), 
-                    rect, 
-                    1
+        grid = robot_nav.grid
+        width = robot_nav.width
+        cell = self.CELL_SIZE
+
+        if self._prev_grid is None:
+            for i, state in enumerate(grid):
+                self.screen.blit(
+                    self._cell_surfs[state],
+                    ((i % width) * cell, (i // width) * cell)
                 )
+            self._prev_grid = bytearray(grid)
+            self._path_cells.clear()
+            return None
+
+        # Repaint cells whose state changed plus cells that still show
+        # last frame's path lines
+        prev = self._prev_grid
+        stale = self._path_cells
+        dirty = []
+        for i in range(len(grid)):
+            state = grid[i]
+            if prev[i] != state or i in stale:
+                x, y = i % width, i // width
+                self.screen.blit(self._cell_surfs[state], (x * cell, y * cell))
+                dirty.append(pygame.Rect(x * cell, y * cell, cell, cell))
+                prev[i] = state
+        stale.clear()
+        return dirty
 
     def draw_path(self, path, robot_nav):
         """
         Draw the robot's path on the grid.
+
+        Returns the rects of the cells the lines cross so they can be
+        pushed to the display and repainted next frame.
         """
-        if len(path) > 1:
+        rects = []
+        if path and len(path) > 1:
             for i in range(len(path) - 1):
                 start_pos = (path[i][0] * self.CELL_SIZE + self.CELL_SIZE // 2, path[i][1] * self.CELL_SIZE + self.CELL_SIZE // 2)
                 end_pos = (path[i + 1][0] * self.CELL_SIZE + self.CELL_SIZE // 2, path[i + 1][1] * self.CELL_SIZE + self.CELL_SIZE // 2)
@@ -224,6 +280,11 @@ class GridVisualization:
                     end_pos,
                     3  # Line width
                 )
+            for x, y in path:
+                self._path_cells.add(y * robot_nav.width + x)
+                rects.append(pygame.Rect(x * self.CELL_SIZE, y * self.CELL_SIZE,
+                                         self.CELL_SIZE, self.CELL_SIZE))
+        return rects
 
 def get_input():
     """
@@ -279,11 +340,14 @@ def main():
             robot_nav.move_robot(path)
         
         # Draw the grid and path
-        grid_viz.draw_grid(robot_nav)
-        grid_viz.draw_path(path,robot_nav)
-        
-        # Update the Pygame display
-        pygame.display.flip()
+        dirty = grid_viz.draw_grid(robot_nav)
+        path_rects = grid_viz.draw_path(path, robot_nav)
+
+        # Push only the changed rects after the first full frame
+        if dirty is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(dirty + path_rects)
         
         # Limit the frame rate
         clock.tick(1)  # Adjust the frame rate for smooth animation
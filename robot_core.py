@@ -0,0 +1,346 @@
+"""
+Shared Numba kernels and constants for the coverage-path planners.
+
+demo.py and demoai.py declare near-identical navigation cores; keeping
+the @njit(cache=True) kernels in one module means they are compiled (and
+their on-disk cache is hit) once instead of per importing script.
+
+All kernels work on flat node ids in padded coordinates
+(y * (width + 2) + x); the padded grid carries an OBSTACLE sentinel
+border so neighbor probes need no bounds checks.
+"""
+import itertools
+
+import numpy as np
+from numba import njit
+
+# cell-state codes mirrored at module level so the @njit kernels can fold
+# them as compile-time constants
+_UNVISITED = 0
+_OBSTACLE = 2
+_DYNAMIC_OBSTACLE = 5
+
+_INF = np.int32(1 << 30)
+
+# the four moves and all 24 orderings of them; picking one row with a
+# single randrange replaces shuffling a fresh list per obstacle
+_DIRS = ((0, 1), (1, 0), (0, -1), (-1, 0))
+_PERMS = tuple(itertools.permutations(range(4)))
+
+# 4-neighborhood kernel for batch unvisited-neighbor counting
+_NBR_KERNEL = np.array([[0, 1, 0],
+                        [1, 0, 1],
+                        [0, 1, 0]], dtype=np.int8)
+
+
+@njit(cache=True)
+def _heap_push(heap, heap_len, entry):
+    """Push a packed (prio << 32) + node entry; returns new length."""
+    i = heap_len
+    heap[i] = entry
+    while i > 0:
+        p = (i - 1) >> 1
+        if heap[p] <= heap[i]:
+            break
+        heap[i], heap[p] = heap[p], heap[i]
+        i = p
+    return heap_len + 1
+
+@njit(cache=True)
+def _heap_pop(heap, heap_len):
+    """Pop the minimum packed entry; returns (entry, new length)."""
+    top = heap[0]
+    heap_len -= 1
+    heap[0] = heap[heap_len]
+    i = 0
+    while True:
+        left = 2 * i + 1
+        right = left + 1
+        smallest = i
+        if left < heap_len and heap[left] < heap[smallest]:
+            smallest = left
+        if right < heap_len and heap[right] < heap[smallest]:
+            smallest = right
+        if smallest == i:
+            break
+        heap[i], heap[smallest] = heap[smallest], heap[i]
+        i = smallest
+    return top, heap_len
+
+@njit(cache=True)
+def _walk_parents(parent, start, goal, out):
+    """
+    Walk parent ids from goal back to start into `out`, reversing in
+    place so the result runs start -> goal; returns the path length.
+    """
+    length = 0
+    node = goal
+    while node != start:
+        out[length] = node
+        node = parent[node]
+        length += 1
+    i = 0
+    j = length - 1
+    while i < j:
+        out[i], out[j] = out[j], out[i]
+        i += 1
+        j -= 1
+    return length
+
+@njit(cache=True)
+def _visit(flat, stride, nid, cur, visited, depth, parent, unvisited_mask,
+           unvis_nbr, heap, heap_len, stamp, version):
+    """
+    Expand one frontier-search neighbor. Returns (new heap length,
+    goal id) where the goal id is the reached unvisited cell or -1.
+    """
+    cell = flat[nid]
+    if cell == _OBSTACLE or cell == _DYNAMIC_OBSTACLE:
+        return heap_len, -1
+    if stamp[nid] != version:
+        # first touch this search: lazily reset the pooled scratch slot
+        stamp[nid] = version
+        visited[nid] = 0
+    if visited[nid] == 1:
+        return heap_len, -1
+
+    parent[nid] = cur
+    depth[nid] = depth[cur] + 1
+
+    if unvisited_mask[nid // stride - 1, nid % stride - 1]:
+        return heap_len, nid
+
+    visited[nid] = 1
+
+    prio = np.int64(depth[nid] - unvis_nbr[nid])
+    heap_len = _heap_push(heap, heap_len, (prio << 32) + nid)
+    return heap_len, -1
+
+@njit(cache=True)
+def _find_path_kernel(padded, width, height, sx, sy, unvisited_mask,
+                      unvis_nbr, parent, visited, depth, heap,
+                      stamp, version):
+    """
+    Frontier search toward the nearest unvisited cell.
+
+    `padded` carries the OBSTACLE sentinel border, so neighbor probes
+    need no bounds checks. Nodes are flat ids in padded coordinates
+    (y * (width + 2) + x); the route is recorded in the `parent` array
+    and the id of the reached unvisited cell is returned, or -1 when the
+    whole frontier is exhausted.
+    """
+    stride = width + 2
+    start = (sy + 1) * stride + (sx + 1)
+    flat = np.ravel(padded)
+    stamp[start] = version
+    visited[start] = 1
+    depth[start] = 0
+    heap_len = _heap_push(heap, 0, np.int64(start))
+
+    while heap_len > 0:
+        entry, heap_len = _heap_pop(heap, heap_len)
+        cur = np.int32(entry & 0xFFFFFFFF)
+        # unrolled 4-neighbor visits: down, right, up, left
+        heap_len, goal = _visit(flat, stride, cur + stride, cur, visited,
+                                depth, parent, unvisited_mask, unvis_nbr,
+                                heap, heap_len, stamp, version)
+        if goal >= 0:
+            return goal
+        heap_len, goal = _visit(flat, stride, cur + 1, cur, visited,
+                                depth, parent, unvisited_mask, unvis_nbr,
+                                heap, heap_len, stamp, version)
+        if goal >= 0:
+            return goal
+        heap_len, goal = _visit(flat, stride, cur - stride, cur, visited,
+                                depth, parent, unvisited_mask, unvis_nbr,
+                                heap, heap_len, stamp, version)
+        if goal >= 0:
+            return goal
+        heap_len, goal = _visit(flat, stride, cur - 1, cur, visited,
+                                depth, parent, unvisited_mask, unvis_nbr,
+                                heap, heap_len, stamp, version)
+        if goal >= 0:
+            return goal
+    return -1
+
+@njit(cache=True)
+def _visit_tiled(flat, stride, tiles_x, nid, cur, visited, depth, parent,
+                 unvisited_mask, unvis_nbr, heap, heap_len, stamp, version,
+                 tile_head, tile_next, tile_stamp):
+    """
+    Tiled twin of _visit: instead of pushing the node itself, chain it
+    into its 8x8 tile bucket and push the tile keyed by the node's
+    priority, so the main loop can drain whole tiles back-to-back.
+    """
+    cell = flat[nid]
+    if cell == _OBSTACLE or cell == _DYNAMIC_OBSTACLE:
+        return heap_len, -1
+    if stamp[nid] != version:
+        stamp[nid] = version
+        visited[nid] = 0
+    if visited[nid] == 1:
+        return heap_len, -1
+
+    parent[nid] = cur
+    depth[nid] = depth[cur] + 1
+
+    if unvisited_mask[nid // stride - 1, nid % stride - 1]:
+        return heap_len, nid
+
+    visited[nid] = 1
+
+    tile = ((nid // stride - 1) >> 3) * tiles_x + ((nid % stride - 1) >> 3)
+    if tile_stamp[tile] != version:
+        tile_stamp[tile] = version
+        tile_head[tile] = -1
+    tile_next[nid] = tile_head[tile]
+    tile_head[tile] = nid
+    prio = np.int64(depth[nid] - unvis_nbr[nid])
+    heap_len = _heap_push(heap, heap_len, (prio << 32) + tile)
+    return heap_len, -1
+
+@njit(cache=True)
+def _find_path_kernel_tiled(padded, width, height, sx, sy, unvisited_mask,
+                            unvis_nbr, parent, visited, depth, heap,
+                            stamp, version, tile_head, tile_next,
+                            tile_stamp):
+    """
+    Frontier search with 8x8 tile-blocked frontier processing.
+
+    Same contract as _find_path_kernel, but the heap orders tiles rather
+    than nodes and every pop drains the whole tile bucket, so nodes that
+    share an L1-resident patch of the grid arrays are expanded
+    back-to-back. Worth it only once the grid outgrows L1; the wrapper
+    keeps small grids on the plain kernel.
+    """
+    stride = width + 2
+    tiles_x = (width + 7) >> 3
+    start = (sy + 1) * stride + (sx + 1)
+    flat = np.ravel(padded)
+    stamp[start] = version
+    visited[start] = 1
+    depth[start] = 0
+    start_tile = (sy >> 3) * tiles_x + (sx >> 3)
+    tile_stamp[start_tile] = version
+    tile_head[start_tile] = -1
+    tile_next[start] = -1
+    tile_head[start_tile] = start
+    heap_len = _heap_push(heap, 0, np.int64(start_tile))
+
+    while heap_len > 0:
+        entry, heap_len = _heap_pop(heap, heap_len)
+        tile = np.int32(entry & 0xFFFFFFFF)
+        if tile_stamp[tile] != version:
+            continue
+        chain = tile_head[tile]
+        tile_head[tile] = -1
+        while chain != -1:
+            cur = chain
+            chain = tile_next[cur]
+            heap_len, goal = _visit_tiled(
+                flat, stride, tiles_x, cur + stride, cur, visited, depth,
+                parent, unvisited_mask, unvis_nbr, heap, heap_len, stamp,
+                version, tile_head, tile_next, tile_stamp)
+            if goal >= 0:
+                return goal
+            heap_len, goal = _visit_tiled(
+                flat, stride, tiles_x, cur + 1, cur, visited, depth,
+                parent, unvisited_mask, unvis_nbr, heap, heap_len, stamp,
+                version, tile_head, tile_next, tile_stamp)
+            if goal >= 0:
+                return goal
+            heap_len, goal = _visit_tiled(
+                flat, stride, tiles_x, cur - stride, cur, visited, depth,
+                parent, unvisited_mask, unvis_nbr, heap, heap_len, stamp,
+                version, tile_head, tile_next, tile_stamp)
+            if goal >= 0:
+                return goal
+            heap_len, goal = _visit_tiled(
+                flat, stride, tiles_x, cur - 1, cur, visited, depth,
+                parent, unvisited_mask, unvis_nbr, heap, heap_len, stamp,
+                version, tile_head, tile_next, tile_stamp)
+            if goal >= 0:
+                return goal
+            if chain == -1 and tile_head[tile] != -1:
+                # expansion refilled the current tile; keep draining it
+                chain = tile_head[tile]
+                tile_head[tile] = -1
+    return -1
+
+@njit(cache=True)
+def _relax(flat, stride, nid, cur, g_score, parent, h_cache, best_prio,
+           ptx, pty, heap, heap_len, stamp, version):
+    """Relax one A* edge into the packed heap; returns the new length."""
+    cell = flat[nid]
+    if cell == _OBSTACLE or cell == _DYNAMIC_OBSTACLE:
+        return heap_len
+    if stamp[nid] != version:
+        # first touch this search: lazily reset the pooled scratch slot
+        stamp[nid] = version
+        g_score[nid] = _INF
+        h_cache[nid] = -1
+        best_prio[nid] = np.int64(1) << 62
+    tentative_g = g_score[cur] + 1
+    if tentative_g < g_score[nid]:
+        g_score[nid] = tentative_g
+        parent[nid] = cur
+        h = h_cache[nid]
+        if h < 0:
+            h = abs(nid % stride - ptx) + abs(nid // stride - pty)
+            h_cache[nid] = h
+        f_score = np.int64(tentative_g + h)
+        if f_score < best_prio[nid]:
+            # decrease-key emulation: remember the best priority ever
+            # pushed so stale duplicates can be dropped on pop
+            best_prio[nid] = f_score
+            heap_len = _heap_push(heap, heap_len, (f_score << 32) + nid)
+    return heap_len
+
+@njit(cache=True)
+def _astar_kernel(padded, width, height, sx, sy, tx, ty, parent,
+                  g_score, h_cache, best_prio, heap, stamp, version):
+    """
+    A* over flat node ids in padded coordinates (y * (width + 2) + x)
+    with a Manhattan heuristic. `padded` carries the OBSTACLE sentinel
+    border, so neighbor probes need no bounds checks.
+
+    The route is recorded in the `parent` array; returns the target id
+    on success or -1 when the target is unreachable.
+    """
+    stride = width + 2
+    start = (sy + 1) * stride + (sx + 1)
+    target = (ty + 1) * stride + (tx + 1)
+    ptx = tx + 1
+    pty = ty + 1
+    flat = np.ravel(padded)
+    stamp[start] = version
+    g_score[start] = 0
+    h_cache[start] = abs(sx - tx) + abs(sy - ty)
+    best_prio[start] = np.int64(h_cache[start])
+    heap_len = _heap_push(heap, 0,
+                          (np.int64(h_cache[start]) << 32) + start)
+
+    while heap_len > 0:
+        entry, heap_len = _heap_pop(heap, heap_len)
+        cur = np.int32(entry & 0xFFFFFFFF)
+        if cur == target:
+            return cur
+        # anything above the best priority ever pushed for this node is
+        # a stale duplicate; one load replaces the g + h recompute
+        if (entry >> 32) > best_prio[cur]:
+            continue
+
+        # unrolled 4-neighbor relaxations: down, right, up, left
+        heap_len = _relax(flat, stride, cur + stride, cur, g_score,
+                          parent, h_cache, best_prio, ptx, pty, heap,
+                          heap_len, stamp, version)
+        heap_len = _relax(flat, stride, cur + 1, cur, g_score,
+                          parent, h_cache, best_prio, ptx, pty, heap,
+                          heap_len, stamp, version)
+        heap_len = _relax(flat, stride, cur - stride, cur, g_score,
+                          parent, h_cache, best_prio, ptx, pty, heap,
+                          heap_len, stamp, version)
+        heap_len = _relax(flat, stride, cur - 1, cur, g_score,
+                          parent, h_cache, best_prio, ptx, pty, heap,
+                          heap_len, stamp, version)
+    return -1